@@ -0,0 +1,112 @@
+"""
+Rollout routines for the MCTS agent
+
+These run once per MCTS simulation, so they work directly on int card
+IDs and plain lists - no GameState copies and no agent calls.
+"""
+import random
+from typing import List, Optional, Sequence, Tuple
+from game.deck import (Suit, CARD_SUIT, SUIT_MASKS, NUM_CARDS, FIRST_NORMAL,
+                       cards_to_mask)
+from game.rules import TRICK_PRIORITY, SCORE_TABLE
+
+# _PLAYABLE[led_suit][card]: card may be played on a trick of led_suit
+# when the player holds that suit (i.e. it follows suit or is special)
+_PLAYABLE = tuple(
+    tuple(CARD_SUIT[card] == led or CARD_SUIT[card] >= Suit.WIZARD
+          for card in range(NUM_CARDS))
+    for led in range(len(Suit) + 1)
+)
+
+def rollout(hands: List[List[int]], current_trick: List[Tuple[int, int]],
+            trick_leader: int, trump_suit: Optional[Suit], bids: List[int],
+            tricks_won: List[int], player_idx: int, plan: Sequence[int] = (),
+            rng=random, masks: Optional[List[int]] = None) -> float:
+    """
+    Play out the rest of the round with random valid cards
+    
+    Starts from player_idx's turn in the current trick. player_idx first
+    plays the cards in plan, in order (they must already be removed from
+    their hand), then random valid cards like everyone else. If a plan
+    card would fail to follow suit, the rest of the plan goes back into
+    the hand and player_idx plays a random valid card instead. The inputs
+    are not modified.
+    
+    masks, if given, are the hands' bitmasks (see cards_to_mask). Callers
+    running many rollouts from the same hands can build them once.
+    
+    Returns:
+        player_idx's score for the round
+    """
+    num_players = len(hands)
+    hands = [hand.copy() for hand in hands]
+    # Bitmask per hand, so "can this player follow suit?" is a single AND
+    if masks is None:
+        masks = [cards_to_mask(hand) for hand in hands]
+    else:
+        masks = masks.copy()
+    tricks_won = tricks_won.copy()
+    # TRICK_PRIORITY rows for this trump, indexed [led_suit][card]
+    priorities = TRICK_PRIORITY[trump_suit or 0]
+    choice = rng.choice
+    trick = current_trick
+    leader = trick_leader
+    plan_idx = 0
+    plan_mask = cards_to_mask(plan)  # Plan cards not yet played
+    
+    for _ in range(len(hands[player_idx]) + len(plan)):
+        led_suit = None
+        priority = priorities[0]  # Until the led suit is known
+        winner, best = leader, -1
+        already_played = len(trick)
+        
+        for i in range(num_players):
+            if i < already_played:
+                p, card = trick[i]
+            else:
+                p = leader + i
+                if p >= num_players:
+                    p -= num_players
+                card = -1
+                if p == player_idx and plan_idx < len(plan):
+                    card = plan[plan_idx]
+                    # Tree actions aren't checked for following suit, so
+                    # the plan can revoke. Unplayed plan cards still count
+                    # as held.
+                    if (led_suit is not None and not _PLAYABLE[led_suit][card]
+                            and (masks[p] | plan_mask) & SUIT_MASKS[led_suit]):
+                        hands[p].extend(plan[plan_idx:])
+                        masks[p] |= plan_mask
+                        plan_idx = len(plan)
+                        card = -1
+                    else:
+                        plan_idx += 1
+                        plan_mask ^= 1 << card
+                if card < 0:
+                    hand = hands[p]
+                    if led_suit is not None and masks[p] & SUIT_MASKS[led_suit]:
+                        playable = _PLAYABLE[led_suit]
+                        card = choice([c for c in hand if playable[c]])
+                    else:
+                        card = choice(hand)  # Anything goes
+                    hand.remove(card)
+                    masks[p] ^= 1 << card
+            
+            # First card sets the led suit, or the second if the first was
+            # special (Jesters and Wizards are the IDs below FIRST_NORMAL)
+            if led_suit is None and i < 2 and card >= FIRST_NORMAL:
+                led_suit = CARD_SUIT[card]
+                priority = priorities[led_suit]
+            
+            # Resolve the trick as it is played (same rule as
+            # WizardRules.determine_trick_winner). Cards played before the
+            # led suit is known are Wizards or Jesters, whose priority
+            # doesn't depend on it.
+            if priority[card] > best:
+                winner, best = p, priority[card]
+        
+        leader = winner
+        tricks_won[leader] += 1
+        trick = ()
+    
+    return SCORE_TABLE[bids[player_idx]][tricks_won[player_idx]]
\ No newline at end of file
@@ -1,8 +1,40 @@
 """
 Heuristic agent that uses simple rules
 """
+from bisect import bisect_right
 from typing import List, Optional
-from game.deck import Card, Suit
+from game.deck import (Card, Suit, CARD_SUIT, CARD_RANK, NUM_CARDS, CARDS,
+                       SUIT_MASKS, cards_to_mask)
+from game.rules import TRICK_PRIORITY
+
+def _bid_weight(card: int, trump_suit: int) -> int:
+    """Chance (in tenths) that a card takes a trick, for bidding"""
+    suit, rank = CARD_SUIT[card], CARD_RANK[card]
+    
+    # Wizards always win (100% confidence)
+    if suit == Suit.WIZARD:
+        return 10
+    
+    # High trump cards (be more conservative) - only Kings and Aces of trump
+    if suit == trump_suit:
+        return 6 if rank >= 13 or rank == 1 else 0  # 60% chance
+    
+    # Aces in non-trump suits (lower confidence - might be trumped)
+    if rank == 1:
+        return 3  # Only 30% chance
+    
+    return 0
+
+# _BID_WEIGHTS[trump][card], trump indexed by suit value (0 = no trump)
+_BID_WEIGHTS = tuple(
+    tuple(_bid_weight(card, trump) for card in range(NUM_CARDS))
+    for trump in range(len(Suit) + 1)
+)
+
+# Jacks and above (never Wizards/Jesters), for the zero-bid adjustment
+_HIGH_CARD_MASK = cards_to_mask(
+    c for c in CARDS if CARD_RANK[c] >= 11 and CARD_SUIT[c] != Suit.JESTER
+)
 
 class HeuristicAgent:
     """Agent that uses hand-crafted heuristics"""
@@ -15,33 +47,19 @@ class HeuristicAgent:
         """
         Bid based on hand strength - MORE CONSERVATIVE
         """
-        likely_tricks = 0
-        
-        # Wizards always win (100% confidence)
-        wizards = [c for c in hand if c.suit == Suit.WIZARD]
-        likely_tricks += len(wizards)
-        
-        # High trump cards (be more conservative)
-        if trump_suit:
-            trumps = [c for c in hand if c.suit == trump_suit]
-            # Only count Kings and Aces of trump
-            high_trumps = [c for c in trumps if c.rank >= 13 or c.rank == 1]
-            likely_tricks += len(high_trumps) * 0.6  # 60% chance
-        
-        # Aces in non-trump suits (lower confidence - might be trumped)
-        for suit in [Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES]:
-            if suit != trump_suit:
-                aces = [c for c in hand if c.suit == suit and c.rank == 1]
-                likely_tricks += len(aces) * 0.3  # Only 30% chance
+        # Sum each card's chance of taking a trick (see _bid_weight)
+        weights = _BID_WEIGHTS[trump_suit or 0]
+        likely_tricks = sum([weights[c] for c in hand]) / 10
         
         # Be conservative: round down and reduce
         bid = int(likely_tricks * 0.5)  # Very conservative
         
         # Additional conservative adjustment: avoid bidding 0 unless very weak
-        if bid == 0 and len(wizards) == 0 and round_num > 1:
-            # If we have any high card, bid at least 1
-            high_cards = [c for c in hand if c.rank >= 11 and c.suit != Suit.JESTER]
-            if high_cards:
+        if bid == 0 and round_num > 1:
+            # If we have any high card (and no Wizard), bid at least 1.
+            # One pass over the hand builds its mask; the checks are ANDs.
+            hand_mask = cards_to_mask(hand)
+            if not hand_mask & SUIT_MASKS[Suit.WIZARD] and hand_mask & _HIGH_CARD_MASK:
                 bid = 1
         
         # Clamp to valid range
@@ -60,7 +78,6 @@ class HeuristicAgent:
         """
         my_bid = state.bids[player_idx]
         my_tricks_won = state.tricks_won[player_idx]
-        tricks_remaining = state.round_num - len([t for t in state.tricks_won if t > 0])
         
         # Determine if we want to win this trick
         want_to_win = my_tricks_won < my_bid
@@ -75,7 +92,7 @@ class HeuristicAgent:
         """Try to win the trick"""
         
         # If we have a Wizard, play it!
-        wizards = [c for c in valid_cards if c.suit == Suit.WIZARD]
+        wizards = [c for c in valid_cards if CARD_SUIT[c] == Suit.WIZARD]
         if wizards:
             return wizards[0]
         
@@ -83,14 +100,14 @@ class HeuristicAgent:
         if not current_trick:
             # Prefer high trump or high cards
             if trump_suit:
-                trumps = [c for c in valid_cards if c.suit == trump_suit]
+                trumps = [c for c in valid_cards if CARD_SUIT[c] == trump_suit]
                 if trumps:
-                    return max(trumps, key=lambda c: c.rank)
+                    return max(trumps, key=lambda c: CARD_RANK[c])
             
             # Otherwise highest card
-            non_jesters = [c for c in valid_cards if c.suit != Suit.JESTER]
+            non_jesters = [c for c in valid_cards if CARD_SUIT[c] != Suit.JESTER]
             if non_jesters:
-                return max(non_jesters, key=lambda c: c.rank)
+                return max(non_jesters, key=lambda c: CARD_RANK[c])
             return valid_cards[0]
         
         # If following, try to beat current winning card
@@ -101,17 +118,17 @@ class HeuristicAgent:
         """Try to avoid winning the trick"""
         
         # Never play Wizards when trying to lose
-        non_wizards = [c for c in valid_cards if c.suit != Suit.WIZARD]
+        non_wizards = [c for c in valid_cards if CARD_SUIT[c] != Suit.WIZARD]
         if non_wizards:
             valid_cards = non_wizards
         
         # Play Jesters if possible
-        jesters = [c for c in valid_cards if c.suit == Suit.JESTER]
+        jesters = [c for c in valid_cards if CARD_SUIT[c] == Suit.JESTER]
         if jesters:
             return jesters[0]
         
         # Play lowest card
-        return min(valid_cards, key=lambda c: c.rank if c.suit != Suit.JESTER else -1)
+        return min(valid_cards, key=lambda c: CARD_RANK[c] if CARD_SUIT[c] != Suit.JESTER else -1)
     
     def _try_to_beat_trick(self, valid_cards: List[Card], current_trick: List,
                           trump_suit: Optional[Suit], led_suit: Optional[Suit]) -> Card:
@@ -119,56 +136,46 @@ class HeuristicAgent:
         
         # Figure out what's currently winning
         current_winner_card = self._get_current_winner(current_trick, led_suit, trump_suit)
+        winner_rank = CARD_RANK[current_winner_card]
         
         # Try to beat it
-        if current_winner_card.suit == Suit.WIZARD:
+        if CARD_SUIT[current_winner_card] == Suit.WIZARD:
             # Can't beat a Wizard, play lowest
-            return min(valid_cards, key=lambda c: c.rank if c.suit != Suit.JESTER else -1)
-        
-        # Try to play higher card of the same category
-        if trump_suit and current_winner_card.suit == trump_suit:
-            # Need higher trump
-            higher_trumps = [c for c in valid_cards 
-                           if c.suit == trump_suit and c.rank > current_winner_card.rank]
-            if higher_trumps:
-                return min(higher_trumps, key=lambda c: c.rank)  # Lowest winning card
-            
-            # Can't beat, play trump anyway or play lowest
-            trumps = [c for c in valid_cards if c.suit == trump_suit]
-            if trumps:
-                return min(trumps, key=lambda c: c.rank)
+            return min(valid_cards, key=lambda c: CARD_RANK[c] if CARD_SUIT[c] != Suit.JESTER else -1)
         
-        # Try trump if we have it
+        # Within a suit card IDs go up with rank, so sorting the IDs gives
+        # rank order and "lowest card above rank r" is one bisect
         if trump_suit:
-            trumps = [c for c in valid_cards if c.suit == trump_suit]
+            trumps = sorted([c for c in valid_cards if CARD_SUIT[c] == trump_suit])
             if trumps:
-                return min(trumps, key=lambda c: c.rank)  # Lowest trump
+                if CARD_SUIT[current_winner_card] == trump_suit:
+                    # Lowest winning trump, or lowest trump if we can't beat it
+                    i = bisect_right(trumps, current_winner_card)
+                    return trumps[i] if i < len(trumps) else trumps[0]
+                return trumps[0]  # Lowest trump
         
         # Try to beat with higher card of led suit
         if led_suit:
-            higher_led = [c for c in valid_cards 
-                         if c.suit == led_suit and c.rank > current_winner_card.rank]
-            if higher_led:
-                return min(higher_led, key=lambda c: c.rank)
+            led = sorted([c for c in valid_cards if CARD_SUIT[c] == led_suit])
+            # Led-suit cards with a higher ID than this outrank the winner
+            i = bisect_right(led, Card(led_suit, 1) + winner_rank - 1)
+            if i < len(led):
+                return led[i]
         
         # Can't win, play lowest card
-        return min(valid_cards, key=lambda c: c.rank if c.suit != Suit.JESTER else -1)
+        return min(valid_cards, key=lambda c: CARD_RANK[c] if CARD_SUIT[c] != Suit.JESTER else -1)
     
     def _get_current_winner(self, current_trick: List[tuple[int, Card]], 
                            led_suit: Optional[Suit], trump_suit: Optional[Suit]) -> Card:
         """Determine which card is currently winning the trick"""
-        from game.rules import WizardRules
-        
         if not current_trick:
             return None
         
-        winner_idx = WizardRules.determine_trick_winner(
-            current_trick, led_suit, trump_suit
-        )
-        
-        # Find the winning card
-        for player_idx, card in current_trick:
-            if player_idx == winner_idx:
-                return card
-        
-        return current_trick[0][1]  # Shouldn't reach here
\ No newline at end of file
+        # Same ordering as WizardRules.determine_trick_winner, but keep the
+        # card itself rather than finding it again from the player index
+        priority = TRICK_PRIORITY[trump_suit or 0][led_suit or 0]
+        winner_card, best = current_trick[0][1], -1
+        for _, card in current_trick:
+            if priority[card] > best:
+                winner_card, best = card, priority[card]
+        return winner_card
\ No newline at end of file
@@ -3,29 +3,30 @@ Monte Carlo Tree Search agent for Wizard
 """
 import random
 import math
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional, Dict, Tuple
-from dataclasses import dataclass
-from game.deck import Card, Suit
+from game.deck import Card, Suit, STANDARD_DECK_SET, cards_to_mask
 from game.simulator import GameState
 from game.rules import WizardRules
+from agents._mcts_kernel import rollout
 
-@dataclass
 class MCTSNode:
     """Node in the MCTS search tree"""
-    state: GameState
-    parent: Optional['MCTSNode'] = None
-    action: Optional[Card] = None  # Action that led to this node
-    children: List['MCTSNode'] = None
-    visits: int = 0
-    total_value: float = 0.0
-    untried_actions: List[Card] = None
-    player_idx: int = 0  # Which player this node is deciding for
+    # Searches create thousands of nodes, so skip the per-instance __dict__
+    __slots__ = ('parent', 'action', 'children', 'visits',
+                 'total_value', 'untried_actions', 'player_idx')
     
-    def __post_init__(self):
-        if self.children is None:
-            self.children = []
-        if self.untried_actions is None:
-            self.untried_actions = []
+    def __init__(self, parent: Optional['MCTSNode'] = None,
+                 action: Optional[Card] = None, player_idx: int = 0,
+                 untried_actions: Optional[List[Card]] = None):
+        self.parent = parent
+        self.action = action  # Action that led to this node
+        self.children: List['MCTSNode'] = []
+        self.visits = 0
+        self.total_value = 0.0
+        self.untried_actions = untried_actions if untried_actions is not None else []
+        self.player_idx = player_idx  # Which player this node is deciding for
     
     @property
     def value(self) -> float:
@@ -34,32 +35,40 @@ class MCTSNode:
             return 0.0
         return self.total_value / self.visits
     
-    def ucb1(self, exploration_constant: float = 1.41) -> float:
-        """UCB1 value for action selection"""
-        if self.visits == 0:
-            return float('inf')
-        
-        exploitation = self.value
-        exploration = exploration_constant * math.sqrt(
-            math.log(self.parent.visits) / self.visits
-        )
-        return exploitation + exploration
-    
     def is_fully_expanded(self) -> bool:
         """Check if all actions have been tried"""
         return len(self.untried_actions) == 0
     
     def is_terminal(self) -> bool:
-        """Check if this is a terminal state (round over)"""
-        # Round is over if all hands are empty
-        return all(len(hand) == 0 for hand in self.state.hands)
+        """Check if this is a terminal state (no cards left to play)"""
+        # The tree only models our own plays, so the search ends with our hand:
+        # a node created with no cards to play has no actions at all
+        return not self.untried_actions and not self.children
+
+
+def _run_one_determinization(agent: 'MCTSAgent', state: GameState, player_idx: int,
+                             valid_cards: List[Card],
+                             seed: Optional[int] = None) -> Dict[Card, Tuple[int, float]]:
+    """
+    Sample one determinization and search it
+    
+    Module-level so it can be sent to worker processes. Workers are given
+    their own seed, otherwise every worker would start from the parent's
+    random state (the agent's generator or the random module's) and
+    sample identical worlds.
+    """
+    if seed is not None:
+        agent._rng.seed(seed)
+    determinized_state = agent._determinize_state(state, player_idx)
+    return agent._mcts_search(determinized_state, player_idx, valid_cards)
 
 
 class MCTSAgent:
     """MCTS agent with determinization for hidden information"""
     
     def __init__(self, name: str = "MCTS", num_simulations: int = 1000, 
-                 num_determinizations: int = 5, exploration_constant: float = 1.41):
+                 num_determinizations: int = 5, exploration_constant: float = 1.41,
+                 num_workers: int = 1, seed: Optional[int] = None):
         """
         Initialize MCTS agent
         
@@ -68,11 +77,20 @@ class MCTSAgent:
             num_simulations: Number of MCTS simulations per decision
             num_determinizations: Number of opponent hand samples
             exploration_constant: UCB exploration parameter (√2 ≈ 1.41)
+            num_workers: Processes to search determinizations in parallel (1 = no pool)
+            seed: Seed for the agent's own random number generator
+                  (None = use the random module)
         """
         self.name = name
         self.num_simulations = num_simulations
         self.num_determinizations = num_determinizations
         self.exploration_constant = exploration_constant
+        self.num_workers = num_workers
+        self._pool = None  # Created on first use
+        self._pool_finalizer = None
+        # Used for determinizations and rollouts. Only seeded agents get
+        # their own generator; otherwise follow random.seed()
+        self._rng = random.Random(seed) if seed is not None else random
         
         # For rollouts, we'll use simple heuristics
         from agents.heuristic_agent import HeuristicAgent
@@ -95,21 +113,61 @@ class MCTSAgent:
         """
         Choose card to play using MCTS with determinization
         """
-        # Run MCTS over multiple determinizations
-        action_values = {card: 0.0 for card in valid_cards}
+        # Run MCTS over multiple determinizations, pooling the root statistics
+        # (visits, total value) of every action across all of them
+        action_stats = {card: [0, 0.0] for card in valid_cards}
         
-        for _ in range(self.num_determinizations):
-            # Sample possible opponent hands
-            determinized_state = self._determinize_state(state, player_idx)
-            
-            # Run MCTS on this determinization
-            best_card, value = self._mcts_search(determinized_state, player_idx, valid_cards)
-            action_values[best_card] += value
+        if self.num_workers > 1:
+            # Determinizations are independent - search them in parallel
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.num_workers)
+                # Shut the workers down with the agent if close() is never called
+                self._pool_finalizer = weakref.finalize(self, self._pool.shutdown)
+            futures = [
+                self._pool.submit(_run_one_determinization, self, state, player_idx,
+                                  valid_cards, self._rng.getrandbits(32))
+                for _ in range(self.num_determinizations)
+            ]
+            results = [future.result() for future in futures]
+        else:
+            results = [
+                _run_one_determinization(self, state, player_idx, valid_cards)
+                for _ in range(self.num_determinizations)
+            ]
+        
+        for root_stats in results:
+            for card, (visits, total_value) in root_stats.items():
+                action_stats[card][0] += visits
+                action_stats[card][1] += total_value
         
-        # Choose action with highest average value
-        best_card = max(action_values.keys(), key=lambda c: action_values[c])
+        # Choose action with highest average value (untried actions last)
+        best_card = max(
+            action_stats.keys(),
+            key=lambda c: (action_stats[c][0] > 0,
+                           action_stats[c][1] / max(1, action_stats[c][0]))
+        )
         return best_card
     
+    def close(self):
+        """Shut down the worker pool, if one was started"""
+        if self._pool is not None:
+            self._pool_finalizer()  # Shuts the pool down (only ever once)
+            self._pool = self._pool_finalizer = None
+    
+    def __getstate__(self):
+        # The pool can't be pickled, and workers don't need it. Neither can
+        # the random module, so it is restored by __setstate__.
+        state = self.__dict__.copy()
+        state['_pool'] = state['_pool_finalizer'] = None
+        if state['_rng'] is random:
+            state['_rng'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._rng is None:
+            self._rng = random
+    
     def _determinize_state(self, state: GameState, player_idx: int) -> GameState:
         """
         Sample a possible world consistent with observations
@@ -122,37 +180,21 @@ class MCTSAgent:
         We don't know:
         - Opponent hands
         """
-        # Create copy of state
-        det_state = state.copy()
-        
-        # Collect unknown cards
-        my_hand = state.hands[player_idx]
-        all_cards = set(range(60))  # Simplified: use card IDs
+        # Copy of state (bids, scores etc. are shared - searches only read them)
+        det_state = state.mcts_clone()
         
         # For simplicity, just randomly deal unknown cards to opponents
         # TODO: Weight by bids and cards played (more sophisticated)
-        unknown_cards = []
         
-        # Get all cards
-        from game.deck import Deck
-        deck = Deck.create_standard_deck()
-        
-        # Remove known cards
-        known_cards = set(my_hand)
-        for hand in state.hands:
-            if hand != my_hand:
-                known_cards.update(hand)
-        
-        # Cards played in current trick
-        for _, card in state.current_trick:
-            known_cards.add(card)
-        
-        if state.trump_card:
+        # Known cards: our hand, the current trick and the trump card
+        known_cards = set(state.hands[player_idx])
+        known_cards.update(card for _, card in state.current_trick)
+        if state.trump_card is not None:
             known_cards.add(state.trump_card)
         
-        # Unknown cards
-        unknown_cards = [c for c in deck if c not in known_cards]
-        random.shuffle(unknown_cards)
+        # Everything else could be in an opponent's hand
+        unknown_cards = list(STANDARD_DECK_SET.difference(known_cards))
+        self._rng.shuffle(unknown_cards)
         
         # Redistribute to opponents
         idx = 0
@@ -165,111 +207,126 @@ class MCTSAgent:
         return det_state
     
     def _mcts_search(self, state: GameState, player_idx: int, 
-                     valid_cards: List[Card]) -> Tuple[Card, float]:
+                     valid_cards: List[Card]) -> Dict[Card, Tuple[int, float]]:
         """
         Run MCTS from current state
         
+        Simulations play moves on state in place and undo them afterwards,
+        so state is back to how it started when this returns.
+        
         Returns:
-            (best_card, value)
+            {card: (visits, total_value)} for each root action that was tried
         """
         # Create root node
         root = MCTSNode(
-            state=state.copy(),
             player_idx=player_idx,
             untried_actions=valid_cards.copy()
         )
         
+        # Hand bitmasks for the rollouts. Only our own hand changes during
+        # the search (by the cards in plan), so build these once
+        root_masks = [cards_to_mask(hand) for hand in state.hands]
+        
         # Run simulations
         for _ in range(self.num_simulations):
             node = root
-            sim_state = state.copy()
+            undo_stack = []
+            plan = []  # Our cards along the path, in play order
             
             # Selection: traverse tree using UCB
             while not node.is_terminal() and node.is_fully_expanded():
                 node = self._select_child(node)
                 # Apply action to simulation state
-                if node.action:
-                    sim_state = self._apply_action(sim_state, node.action, node.player_idx)
+                undo_stack.append(self._apply_action(state, node.action, node.player_idx))
+                plan.append(node.action)
             
             # Expansion: add new child if not terminal
             if not node.is_terminal() and not node.is_fully_expanded():
-                node = self._expand(node, sim_state)
-                if node.action:
-                    sim_state = self._apply_action(sim_state, node.action, node.player_idx)
+                node = self._expand(node, state, undo_stack)
+                plan.append(node.action)
             
             # Simulation: rollout to end of round
-            value = self._simulate(sim_state, player_idx)
+            value = self._simulate(state, player_idx, plan, root_masks)
             
             # Backpropagation: update values
             self._backpropagate(node, value)
+            
+            # Walk the state back to the root
+            while undo_stack:
+                state.undo(undo_stack.pop())
         
-        # Choose best action (most visited)
-        if not root.children:
-            return valid_cards[0], 0.0
-        
-        best_child = max(root.children, key=lambda c: c.visits)
-        return best_child.action, best_child.value
+        return {child.action: (child.visits, child.total_value) for child in root.children}
     
     def _select_child(self, node: MCTSNode) -> MCTSNode:
-        """Select child with highest UCB value"""
-        return max(node.children, key=lambda c: c.ucb1(self.exploration_constant))
+        """Select child with highest UCB1 value"""
+        # ln(parent visits) is shared by every child, so compute it once
+        log_n = math.log(node.visits)
+        c = self.exploration_constant
+        sqrt = math.sqrt
+        
+        best_child, best_ucb = None, -math.inf
+        for child in node.children:
+            if child.visits == 0:
+                return child  # Unvisited children have infinite UCB
+            ucb = child.total_value / child.visits + c * sqrt(log_n / child.visits)
+            if ucb > best_ucb:
+                best_child, best_ucb = child, ucb
+        return best_child
     
-    def _expand(self, node: MCTSNode, state: GameState) -> MCTSNode:
-        """Expand node by trying an untried action"""
+    def _expand(self, node: MCTSNode, state: GameState, undo_stack: List) -> MCTSNode:
+        """Expand node by trying an untried action (applied to state, undo token pushed)"""
         action = node.untried_actions.pop()
         
         # Create child node
-        child_state = self._apply_action(state.copy(), action, node.player_idx)
+        undo_stack.append(self._apply_action(state, action, node.player_idx))
         child = MCTSNode(
-            state=child_state,
             parent=node,
             action=action,
             player_idx=node.player_idx,
-            untried_actions=self._get_valid_actions(child_state, node.player_idx)
+            untried_actions=self._get_valid_actions(state, node.player_idx)
         )
         
         node.children.append(child)
         return child
     
-    def _apply_action(self, state: GameState, card: Card, player_idx: int) -> GameState:
+    def _apply_action(self, state: GameState, card: Card, player_idx: int) -> Tuple:
         """
-        Apply a card play action to the state
+        Apply a card play action to the state, in place
         
         Simplified version - just for simulation purposes
+        
+        Returns:
+            Undo token for state.undo()
         """
         # This is a simplified state transition
         # For full game simulation, you'd need to track trick progression
         
         # Remove card from hand
-        if card in state.hands[player_idx]:
-            state.hands[player_idx].remove(card)
-        
-        return state
+        return state.apply(card, player_idx)
     
     def _get_valid_actions(self, state: GameState, player_idx: int) -> List[Card]:
         """Get valid cards for current player"""
         # Simplified - in real version, would check suit following rules
         return state.hands[player_idx].copy()
     
-    def _simulate(self, state: GameState, player_idx: int) -> float:
+    def _simulate(self, state: GameState, player_idx: int, plan: List[Card],
+                  root_masks: Optional[List[int]] = None) -> float:
         """
         Simulate rest of round using rollout policy
         
-        Returns reward for player_idx
-        """
-        # Simplified simulation: use heuristic agent for rollout
-        # In real version, would complete the round and calculate score
-        
-        # For now, return a simple heuristic value based on current state
-        my_bid = state.bids[player_idx]
-        my_tricks = state.tricks_won[player_idx]
+        We play the cards in plan (the path through the tree) on our next
+        turns; after that everyone plays random valid cards. root_masks are
+        the hand bitmasks from before any card in plan was played.
         
-        # Estimate final score
-        # Positive if on track, negative if off track
-        if my_bid == my_tricks:
-            return 20 + 10 * my_bid
-        else:
-            return -10 * abs(my_bid - my_tricks)
+        Returns reward for player_idx (their score for the round)
+        """
+        masks = None
+        if root_masks is not None:
+            masks = root_masks.copy()
+            masks[player_idx] ^= cards_to_mask(plan)
+        return rollout(state.hands, state.current_trick, state.trick_leader,
+                       state.trump_suit, state.bids, state.tricks_won,
+                       player_idx, plan, self._rng, masks)
     
     def _backpropagate(self, node: MCTSNode, value: float):
         """Backpropagate value up the tree"""
@@ -1,18 +1,17 @@
 """
 Simplified MCTS agent for initial testing
 """
-import random
 from typing import List, Optional
-from game.deck import Card, Suit
+from game.deck import Card, Suit, CARD_SUIT, CARD_RANK
 from game.simulator import GameState
 from agents.heuristic_agent import HeuristicAgent
 
 class SimpleMCTSAgent:
-    """Simplified MCTS agent that uses Monte Carlo rollouts"""
+    """Simplified MCTS agent that scores each card by its expected value"""
     
     def __init__(self, name: str = "SimpleMCTS", num_simulations: int = 100):
         self.name = name
-        self.num_simulations = num_simulations
+        self.num_simulations = num_simulations  # Kept for compatibility; values are exact
         self.heuristic = HeuristicAgent()
     
     def bid(self, hand: List[Card], trump_suit: Optional[Suit], round_num: int,
@@ -24,11 +23,11 @@ class SimpleMCTSAgent:
              current_trick: List[tuple[int, Card]], trump_suit: Optional[Suit],
              led_suit: Optional[Suit], player_idx: int, state: GameState) -> Card:
         """
-        Choose card using simple Monte Carlo evaluation
+        Choose card using simple expected-value evaluation
         
         For each valid card:
-        - Simulate playing it
-        - Estimate value
+        - Estimate its chance of winning the trick
+        - Compute expected value of playing it
         - Choose best
         """
         if len(valid_cards) == 1:
@@ -37,14 +36,7 @@ class SimpleMCTSAgent:
         card_values = {}
         
         for card in valid_cards:
-            total_value = 0.0
-            
-            # Run simulations for this card
-            for _ in range(self.num_simulations):
-                value = self._simulate_card(card, state, player_idx)
-                total_value += value
-            
-            card_values[card] = total_value / self.num_simulations
+            card_values[card] = self._simulate_card(card, state, player_idx)
         
         # Choose best card
         best_card = max(card_values.keys(), key=lambda c: card_values[c])
@@ -52,7 +44,7 @@ class SimpleMCTSAgent:
     
     def _simulate_card(self, card: Card, state: GameState, player_idx: int) -> float:
         """
-        Simulate playing a card and estimate value
+        Expected value of playing a card
         
         Simple heuristic value:
         - Positive if helps meet bid
@@ -60,47 +52,45 @@ class SimpleMCTSAgent:
         """
         my_bid = state.bids[player_idx]
         my_tricks = state.tricks_won[player_idx]
-        tricks_left = state.round_num - sum(1 for t in state.tricks_won if t > 0)
-        
-        # Estimate if this card will win the trick
-        will_win = self._estimate_win_probability(card, state, player_idx)
         
         # Value based on whether we want to win
         want_to_win = my_tricks < my_bid
         
-        if want_to_win and will_win:
-            return 10  # Good - helps meet bid
-        elif not want_to_win and not will_win:
-            return 10  # Good - avoids extra trick
-        elif want_to_win and not will_win:
-            return -5  # Bad - needed to win
-        else:  # not want_to_win and will_win
-            return -10  # Bad - unwanted trick
+        if want_to_win:
+            win_value = 10   # Good - helps meet bid
+            lose_value = -5  # Bad - needed to win
+        else:
+            win_value = -10  # Bad - unwanted trick
+            lose_value = 10  # Good - avoids extra trick
+        
+        # Average over win/lose directly instead of sampling it
+        p_win = self._estimate_win_probability(card, state, player_idx)
+        return p_win * win_value + (1 - p_win) * lose_value
     
     def _estimate_win_probability(self, card: Card, state: GameState, 
-                                   player_idx: int) -> bool:
-        """Roughly estimate if this card will win the trick"""
-        from game.deck import Suit
+                                   player_idx: int) -> float:
+        """Roughly estimate the chance that this card wins the trick"""
+        suit, rank = CARD_SUIT[card], CARD_RANK[card]
         
         # Wizard always wins
-        if card.suit == Suit.WIZARD:
-            return True
+        if suit == Suit.WIZARD:
+            return 1.0
         
         # Jester rarely wins
-        if card.suit == Suit.JESTER:
-            return False
+        if suit == Suit.JESTER:
+            return 0.0
         
         # High cards more likely to win
         # High trump very likely
-        if state.trump_suit and card.suit == state.trump_suit and card.rank >= 10:
-            return True
+        if state.trump_suit and suit == state.trump_suit and rank >= 10:
+            return 1.0
         
         # Aces somewhat likely
-        if card.rank == 1:  # Ace
-            return random.random() > 0.3
+        if rank == 1:  # Ace
+            return 0.7
         
         # High cards maybe
-        if card.rank >= 11:
-            return random.random() > 0.5
+        if rank >= 11:
+            return 0.5
         
-        return False
\ No newline at end of file
+        return 0.0
\ No newline at end of file
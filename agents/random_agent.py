@@ -2,19 +2,21 @@
 Random agent that makes random decisions
 """
 import random
-from typing import List
+from typing import List, Optional
 from game.deck import Card, Suit
 
 class RandomAgent:
     """Agent that plays randomly"""
     
-    def __init__(self, name: str = "Random"):
+    def __init__(self, name: str = "Random", seed: Optional[int] = None):
         self.name = name
+        # Own generator only when seeded; otherwise follow random.seed()
+        self._rng = random.Random(seed) if seed is not None else random
     
     def bid(self, hand: List[Card], trump_suit, round_num, player_idx, bids_so_far) -> int:
         """Make a random bid between 0 and number of cards"""
-        return random.randint(0, round_num)
+        return self._rng.randint(0, round_num)
     
     def play(self, hand: List[Card], valid_cards: List[Card], **kwargs) -> Card:
         """Play a random valid card"""
-        return random.choice(valid_cards)
\ No newline at end of file
+        return self._rng.choice(valid_cards)
\ No newline at end of file
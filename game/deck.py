@@ -1,37 +1,131 @@
 """
 Card and deck representations for Wizard
 """
-from enum import Enum
-from dataclasses import dataclass
+from enum import Enum, IntEnum
 from typing import List
 import random
 
-class Suit(Enum):
-    HEARTS = 'H'
-    DIAMONDS = 'D'
-    CLUBS = 'C'
-    SPADES = 'S'
-    WIZARD = 'W'
-    JESTER = 'J'
+class Suit(IntEnum):
+    HEARTS = 1
+    DIAMONDS = 2
+    CLUBS = 3
+    SPADES = 4
+    WIZARD = 5
+    JESTER = 6
+    
+    # Keep "Suit.HEARTS" rather than "1", in str() and f-strings alike
+    # (IntEnum formats as the int on some Python versions)
+    __str__ = Enum.__str__
+    
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+NORMAL_SUITS = (Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES)
+SUIT_LETTERS = {Suit.HEARTS: 'H', Suit.DIAMONDS: 'D', Suit.CLUBS: 'C',
+                Suit.SPADES: 'S', Suit.WIZARD: 'W', Suit.JESTER: 'J'}
+
+# Card IDs follow the standard deck order:
+#   0-3 Jesters, 4-7 Wizards, then 13 cards (A..K) each of H, D, C, S
+NUM_CARDS = 60
+FIRST_WIZARD = 4
+FIRST_NORMAL = 8
+
+def _card_suit_rank(card_id: int) -> tuple:
+    if card_id < FIRST_WIZARD:
+        return Suit.JESTER, 0
+    if card_id < FIRST_NORMAL:
+        return Suit.WIZARD, 0
+    suit_idx, rank_idx = divmod(card_id - FIRST_NORMAL, 13)
+    return NORMAL_SUITS[suit_idx], rank_idx + 1
+
+# Lookup tables indexed by card ID - use these in hot loops instead of
+# the Card.suit / Card.rank properties
+CARD_SUIT = tuple(_card_suit_rank(i)[0] for i in range(NUM_CARDS))
+CARD_RANK = tuple(_card_suit_rank(i)[1] for i in range(NUM_CARDS))
+
+def _card_name(card_id: int) -> str:
+    suit, rank = CARD_SUIT[card_id], CARD_RANK[card_id]
+    if suit == Suit.WIZARD:
+        return "Wizard"
+    elif suit == Suit.JESTER:
+        return "Jester"
+    else:
+        rank_names = {1: 'A', 11: 'J', 12: 'Q', 13: 'K'}
+        rank_str = rank_names.get(rank, str(rank))
+        return f"{rank_str}{SUIT_LETTERS[suit]}"
 
-@dataclass(frozen=True)
-class Card:
-    """Represents a single card"""
-    suit: Suit
-    rank: int  # 1-13 for normal cards, 0 for Wizard/Jester
+CARD_NAMES = tuple(_card_name(i) for i in range(NUM_CARDS))
+
+class Card(int):
+    """
+    Represents a single card, encoded as its ID (0-59) in the standard deck
+    
+    Cards are plain ints underneath, so hashing and comparisons are cheap.
+    All 60 cards are created once (see CARDS); Card(suit, rank) returns
+    the shared instance. The four Wizards (and four Jesters) are distinct
+    cards - Card(Suit.WIZARD, 0) gives the first one.
+    """
+    __slots__ = ()
+    
+    def __new__(cls, suit: Suit, rank: int):
+        if suit == Suit.JESTER:
+            return CARDS[0]
+        if suit == Suit.WIZARD:
+            return CARDS[FIRST_WIZARD]
+        if not 1 <= rank <= 13:
+            raise ValueError(f"Invalid rank {rank} for {suit}")
+        return CARDS[FIRST_NORMAL + NORMAL_SUITS.index(suit) * 13 + rank - 1]
+    
+    @property
+    def suit(self) -> Suit:
+        return CARD_SUIT[self]
+    
+    @property
+    def rank(self) -> int:
+        """1-13 for normal cards, 0 for Wizard/Jester"""
+        return CARD_RANK[self]
     
     def __str__(self):
-        if self.suit == Suit.WIZARD:
-            return "Wizard"
-        elif self.suit == Suit.JESTER:
-            return "Jester"
-        else:
-            rank_names = {1: 'A', 11: 'J', 12: 'Q', 13: 'K'}
-            rank_str = rank_names.get(self.rank, str(self.rank))
-            return f"{rank_str}{self.suit.value}"
+        return CARD_NAMES[self]
     
     def __repr__(self):
         return str(self)
+    
+    def __bool__(self):
+        # Card 0 (a Jester) is still a card, not a false value
+        return True
+    
+    # Cards are immutable flyweights: copies and unpickled cards are the
+    # shared instance from CARDS, never a new object
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        # int's default would call Card(id)
+        return (_card_by_id, (int(self),))
+
+# The 60 canonical card instances, indexed by card ID
+CARDS = tuple(int.__new__(Card, i) for i in range(NUM_CARDS))
+STANDARD_DECK_SET = frozenset(CARDS)
+
+def _card_by_id(card_id: int) -> Card:
+    return CARDS[card_id]
+
+# Bitmask of every card in each suit (bit i = card ID i), indexed by suit value
+SUIT_MASKS = tuple(
+    sum(1 << card_id for card_id in range(NUM_CARDS) if CARD_SUIT[card_id] == suit)
+    for suit in range(len(Suit) + 1)
+)
+
+def cards_to_mask(cards) -> int:
+    """Bitmask of a collection of cards (bit i set for card ID i)"""
+    mask = 0
+    for card in cards:
+        mask |= 1 << card
+    return mask
 
 class Deck:
     """Creates and manages the Wizard deck"""
@@ -39,44 +133,29 @@ class Deck:
     @staticmethod
     def create_standard_deck() -> List[Card]:
         """Create a standard 60-card Wizard deck"""
-        cards = []
-        
-        # Add 4 Jesters
-        for _ in range(4):
-            cards.append(Card(Suit.JESTER, 0))
-        
-        # Add 4 Wizards
-        for _ in range(4):
-            cards.append(Card(Suit.WIZARD, 0))
-        
-        # Add standard 52 cards (1-13 in each suit)
-        for suit in [Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES]:
-            for rank in range(1, 14):  # 1 = Ace, 13 = King
-                cards.append(Card(suit, rank))
-        
-        return cards
+        return list(CARDS)
     
     @staticmethod
-    def shuffle_and_deal(num_players: int, round_num: int) -> tuple:
+    def shuffle_and_deal(num_players: int, round_num: int, rng=random) -> tuple:
         """
         Shuffle deck and deal cards for a round
         
+        rng is the random.Random to draw from (default: the random module)
+        
         Returns:
-            (player_hands, trump_card, remaining_deck)
+            (player_hands, trump_card, remaining_deck), with the undealt
+            cards of remaining_deck in deck order
         """
-        deck = Deck.create_standard_deck()
-        random.shuffle(deck)
-        
-        # Deal cards
-        hands = [[] for _ in range(num_players)]
-        card_idx = 0
+        # Only the dealt cards and the trump need to be drawn - far fewer
+        # random draws than shuffling all 60 cards in the early rounds
+        num_dealt = num_players * round_num
+        drawn = rng.sample(CARDS, min(num_dealt + 1, NUM_CARDS))
         
-        for _ in range(round_num):  # Each player gets 'round_num' cards
-            for player_idx in range(num_players):
-                hands[player_idx].append(deck[card_idx])
-                card_idx += 1
+        # Deal cards: each player gets a block of 'round_num' cards. The draw
+        # is already random, so this is as fair as dealing one at a time.
+        hands = [drawn[p * round_num:(p + 1) * round_num] for p in range(num_players)]
         
         # Trump card (if cards remain)
-        trump_card = deck[card_idx] if card_idx < len(deck) else None
+        trump_card = drawn[num_dealt] if num_dealt < NUM_CARDS else None
         
-        return hands, trump_card, deck[card_idx+1:]
\ No newline at end of file
+        return hands, trump_card, sorted(STANDARD_DECK_SET.difference(drawn))
\ No newline at end of file
@@ -1,9 +1,60 @@
 """
 Game rules for Wizard
 """
-from game.deck import Card, Suit
+from game.deck import Card, Suit, CARD_SUIT, CARD_RANK, NUM_CARDS
 from typing import List, Optional
 
+def _trick_priority(card: int, trump_suit: int, led_suit: int) -> int:
+    """Rank a card within a trick: a higher priority beats a lower one"""
+    suit, rank = CARD_SUIT[card], CARD_RANK[card]
+    if suit == Suit.WIZARD:
+        return 3 << 4
+    if suit == Suit.JESTER:
+        return 0
+    if suit == trump_suit:
+        return (2 << 4) | rank
+    if suit == led_suit:
+        return (1 << 4) | rank
+    return 0  # Off-suit cards can't win
+
+# TRICK_PRIORITY[trump][led][card], suits indexed by value (0 = no suit).
+# Equal priorities go to the card played first, so the first Wizard wins
+# and an all-Jester trick goes to the leader.
+TRICK_PRIORITY = tuple(
+    tuple(
+        tuple(_trick_priority(card, trump, led) for card in range(NUM_CARDS))
+        for led in range(len(Suit) + 1)
+    )
+    for trump in range(len(Suit) + 1)
+)
+
+def _trump_suit(card: int) -> Optional[Suit]:
+    """Trump suit when this card is turned up"""
+    suit = CARD_SUIT[card]
+    if suit == Suit.JESTER:
+        return None  # Jester = no trump
+    elif suit == Suit.WIZARD:
+        # In real game, dealer chooses. For now, default to Hearts
+        return Suit.HEARTS  # TODO: Let dealer choose
+    return suit
+
+# TRUMP_SUIT[card]: trump suit for each possible trump card
+TRUMP_SUIT = tuple(_trump_suit(card) for card in range(NUM_CARDS))
+
+def _round_score(bid: int, tricks_won: int) -> int:
+    """Correct bid: 20 + 10*n; wrong bid: -10 per trick off"""
+    if bid == tricks_won:
+        return 20 + 10 * bid
+    return -10 * abs(bid - tricks_won)
+
+MAX_TRICKS = NUM_CARDS // 3  # Most cards in a hand (3 players, last round)
+
+# SCORE_TABLE[bid][tricks_won]: a player's score for the round
+SCORE_TABLE = tuple(
+    tuple(_round_score(bid, won) for won in range(MAX_TRICKS + 1))
+    for bid in range(MAX_TRICKS + 1)
+)
+
 class WizardRules:
     """Implements Wizard game rules"""
     
@@ -12,13 +63,7 @@ class WizardRules:
         """Determine trump suit from trump card"""
         if trump_card is None:
             return None  # Last round, no trump
-        elif trump_card.suit == Suit.JESTER:
-            return None  # Jester = no trump
-        elif trump_card.suit == Suit.WIZARD:
-            # In real game, dealer chooses. For now, default to Hearts
-            return Suit.HEARTS  # TODO: Let dealer choose
-        else:
-            return trump_card.suit
+        return TRUMP_SUIT[trump_card]  # See _trump_suit
     
     @staticmethod
     def get_valid_plays(hand: List[Card], led_suit: Optional[Suit]) -> List[Card]:
@@ -34,13 +79,20 @@ class WizardRules:
         if led_suit is None:
             return hand.copy()
         
-        # Can always play Wizard or Jester
-        same_suit = [c for c in hand if c.suit == led_suit]
+        # One pass: collect the led suit plus Wizards/Jesters (always playable)
+        valid = []
+        has_led_suit = False
+        for card in hand:
+            suit = CARD_SUIT[card]
+            if suit == led_suit:
+                has_led_suit = True
+                valid.append(card)
+            elif suit >= Suit.WIZARD:  # Wizard or Jester
+                valid.append(card)
         
         # If you have the led suit, must play it (or Wizard/Jester)
-        if same_suit:
-            wizards_jesters = [c for c in hand if c.suit in [Suit.WIZARD, Suit.JESTER]]
-            return same_suit + wizards_jesters
+        if has_led_suit:
+            return valid
         
         # If you don't have led suit, can play anything
         return hand.copy()
@@ -56,33 +108,13 @@ class WizardRules:
         
         Returns: player_idx of winner
         """
-        # Rule 1: First Wizard played wins
+        # Wizard > trump > led suit > everything else; ties go to the earlier card
+        priority = TRICK_PRIORITY[trump_suit or 0][led_suit or 0]
+        winner, best = cards_played[0][0], -1
         for player_idx, card in cards_played:
-            if card.suit == Suit.WIZARD:
-                return player_idx
-        
-        # Rule 2: If all Jesters, first Jester wins
-        if all(card.suit == Suit.JESTER for _, card in cards_played):
-            return cards_played[0][0]
-        
-        # Filter out Jesters (they can't win unless all Jesters)
-        non_jesters = [(p, c) for p, c in cards_played if c.suit != Suit.JESTER]
-        
-        # Rule 3: Highest trump wins
-        if trump_suit:
-            trumps = [(p, c) for p, c in non_jesters if c.suit == trump_suit]
-            if trumps:
-                winner = max(trumps, key=lambda x: x[1].rank)
-                return winner[0]
-        
-        # Rule 4: Highest card of led suit wins
-        led_cards = [(p, c) for p, c in non_jesters if c.suit == led_suit]
-        if led_cards:
-            winner = max(led_cards, key=lambda x: x[1].rank)
-            return winner[0]
-        
-        # Shouldn't reach here, but just in case
-        return cards_played[0][0]
+            if priority[card] > best:
+                winner, best = player_idx, priority[card]
+        return winner
     
     @staticmethod
     def score_round(bid: int, tricks_won: int) -> int:
@@ -92,7 +124,6 @@ class WizardRules:
         Correct bid: 20 + 10*n
         Wrong bid: -10 per trick off
         """
-        if bid == tricks_won:
-            return 20 + 10 * bid
-        else:
-            return -10 * abs(bid - tricks_won)
\ No newline at end of file
+        if 0 <= bid <= MAX_TRICKS and 0 <= tricks_won <= MAX_TRICKS:
+            return SCORE_TABLE[bid][tricks_won]
+        return _round_score(bid, tricks_won)  # Outside the table
\ No newline at end of file
@@ -1,10 +1,11 @@
 """
 Main Wizard game simulator
 """
-from typing import List, Optional
+import random
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
-from game.deck import Deck, Card, Suit
-from game.rules import WizardRules
+from game.deck import Deck, Card, Suit, CARDS, CARD_SUIT, FIRST_NORMAL
+from game.rules import WizardRules, SCORE_TABLE
 
 @dataclass
 class GameState:
@@ -22,28 +23,53 @@ class GameState:
     
     def copy(self):
         """Create a copy of the game state"""
-        return GameState(
-            num_players=self.num_players,
-            round_num=self.round_num,
-            hands=[hand.copy() for hand in self.hands],
-            trump_card=self.trump_card,
-            trump_suit=self.trump_suit,
-            bids=self.bids.copy(),
-            tricks_won=self.tricks_won.copy(),
-            scores=self.scores.copy(),
-            current_trick=self.current_trick.copy(),
-            trick_leader=self.trick_leader
-        )
+        # Built on mcts_clone, which skips the dataclass __init__ and copies
+        # the instance dict in one go; then unshare the remaining lists
+        clone = self.mcts_clone()
+        clone.bids = self.bids.copy()
+        clone.scores = self.scores.copy()
+        return clone
+    
+    def mcts_clone(self):
+        """
+        Cheaper copy for search: only the fields a search changes
+        (hands, tricks_won, current_trick) are copied, the rest is shared
+        and must be treated as read-only
+        """
+        clone = object.__new__(GameState)
+        clone.__dict__ = self.__dict__.copy()
+        clone.hands = [hand.copy() for hand in self.hands]
+        clone.tricks_won = self.tricks_won.copy()
+        clone.current_trick = self.current_trick.copy()
+        return clone
+    
+    def apply(self, card: Card, player_idx: int) -> Tuple[int, Card, int]:
+        """
+        Take a card out of a player's hand, in place
+        
+        Returns an undo token; undo(token) puts the card back. Exploring
+        moves this way is much cheaper than copying the state for each one.
+        """
+        hand = self.hands[player_idx]
+        hand_idx = hand.index(card)
+        del hand[hand_idx]
+        return player_idx, card, hand_idx
+    
+    def undo(self, token: Tuple[int, Card, int]):
+        """Reverse an apply() (undo tokens in the reverse order they were made)"""
+        player_idx, card, hand_idx = token
+        self.hands[player_idx].insert(hand_idx, card)
 
 class WizardGame:
     """Manages a full game of Wizard"""
     
-    def __init__(self, num_players: int = 4):
+    def __init__(self, num_players: int = 4, seed: Optional[int] = None):
         """
         Initialize a new game
         
         Args:
             num_players: Number of players (3-6)
+            seed: Seed for dealing, so games can be replayed
         """
         if num_players < 3 or num_players > 6:
             raise ValueError("Wizard requires 3-6 players")
@@ -52,7 +78,17 @@ class WizardGame:
         self.total_rounds = 60 // num_players  # 20 for 3p, 15 for 4p, etc.
         self.scores = [0] * num_players
         self.state = None
+        self._suit_buckets = None  # Per player: cards in hand by suit value
+        # _rot[leader + i] is the i-th player after leader, without a modulo
+        self._rot = list(range(num_players)) * 2
+        # _trick_entries[player][card]: the (player, card) pairs that make up
+        # current_trick, built once instead of a new tuple per play
+        self._trick_entries = [[(player_idx, card) for card in CARDS]
+                               for player_idx in range(num_players)]
         self.verbose = False  # Set to True for debug output
+        # Deal from the random module (so random.seed() still applies) unless
+        # this game has its own seed
+        self._rng = random.Random(seed) if seed is not None else random
     
     def play_full_game(self, agents: List) -> List[int]:
         """
@@ -79,7 +115,7 @@ class WizardGame:
         """Play a single round"""
         
         # Deal cards
-        hands, trump_card, _ = Deck.shuffle_and_deal(self.num_players, round_num)
+        hands, trump_card, _ = Deck.shuffle_and_deal(self.num_players, round_num, self._rng)
         trump_suit = WizardRules.get_trump_suit(trump_card)
         
         # Initialize round state
@@ -96,30 +132,44 @@ class WizardGame:
             trick_leader=0  # Player 0 leads first trick
         )
         
+        # Index each hand by suit once, so finding the valid plays for a
+        # trick doesn't mean rescanning the whole hand
+        self._suit_buckets = []
+        for hand in hands:
+            buckets = [[] for _ in range(len(Suit) + 1)]
+            for card in hand:
+                buckets[CARD_SUIT[card]].append(card)
+            self._suit_buckets.append(buckets)
+        
         if self.verbose:
             print(f"\n{'='*50}")
             print(f"ROUND {round_num}")
             print(f"Trump: {trump_card} ({trump_suit})")
         
+        # Bind each agent's methods once for the round, rather than looking
+        # them up on every bid and play
+        bid_fns = [agent.bid for agent in agents]
+        play_fns = [agent.play for agent in agents]
+        
         # Bidding phase
-        self._bidding_phase(agents)
+        self._bidding_phase(bid_fns)
         
         # Playing phase (multiple tricks)
         for trick_num in range(round_num):
-            self._play_trick(agents)
+            self._play_trick(play_fns)
         
         # Score the round
         self._score_round()
     
-    def _bidding_phase(self, agents: List):
-        """Handle bidding for all players"""
+    def _bidding_phase(self, bid_fns: List):
+        """Handle bidding for all players (bid_fns: each agent's bound bid())"""
         
         if self.verbose:
             print(f"\n--- Bidding Phase ---")
         
         for player_idx in range(self.num_players):
             # Agent makes bid decision
-            bid = agents[player_idx].bid(
+            bid = bid_fns[player_idx](
                 hand=self.state.hands[player_idx],
                 trump_suit=self.state.trump_suit,
                 round_num=self.state.round_num,
@@ -139,55 +189,25 @@ class WizardGame:
         if self.verbose:
             print(f"Total bids: {sum(self.state.bids)}/{self.state.round_num} tricks")
     
-    def _play_trick(self, agents: List):
-        """Play a single trick"""
+    def _play_trick(self, play_fns: List):
+        """Play a single trick (play_fns: each agent's bound play())"""
         
-        self.state.current_trick = []
-        led_suit = None
+        self.state.current_trick.clear()  # Reuse the round's list
+        leader = self.state.trick_leader
         
-        if self.verbose:
-            print(f"\n--- Trick (Leader: Player {self.state.trick_leader}) ---")
+        # First card determines led suit (unless it's Jester or Wizard; those
+        # are the card IDs below FIRST_NORMAL)
+        card = self._play_card(play_fns, leader, None)
+        led_suit = CARD_SUIT[card] if card >= FIRST_NORMAL else None
         
-        # Each player plays a card
-        for i in range(self.num_players):
-            player_idx = (self.state.trick_leader + i) % self.num_players
-            
-            # Get valid plays
-            valid_cards = WizardRules.get_valid_plays(
-                self.state.hands[player_idx],
-                led_suit
-            )
-            
-            # Agent chooses card
-            card = agents[player_idx].play(
-                hand=self.state.hands[player_idx],
-                valid_cards=valid_cards,
-                current_trick=self.state.current_trick,
-                trump_suit=self.state.trump_suit,
-                led_suit=led_suit,
-                player_idx=player_idx,
-                state=self.state
-            )
-            
-            # Validate card choice
-            if card not in valid_cards:
-                raise ValueError(f"Invalid card play: {card} not in {valid_cards}")
-            
-            # Remove card from hand
-            self.state.hands[player_idx].remove(card)
-            
-            # Add to trick
-            self.state.current_trick.append((player_idx, card))
-            
-            # First card determines led suit (unless it's Jester or Wizard)
-            if i == 0 and card.suit not in [Suit.JESTER, Suit.WIZARD]:
-                led_suit = card.suit
-            elif i == 1 and led_suit is None and card.suit not in [Suit.JESTER, Suit.WIZARD]:
-                # If first card was Jester, second card sets suit
-                led_suit = card.suit
-            
-            if self.verbose:
-                print(f"  Player {player_idx} plays {card}")
+        # If first card was Jester, second card sets suit
+        card = self._play_card(play_fns, self._rot[leader + 1], led_suit)
+        if led_suit is None and card >= FIRST_NORMAL:
+            led_suit = CARD_SUIT[card]
+        
+        # Everyone else just plays
+        for i in range(2, self.num_players):
+            self._play_card(play_fns, self._rot[leader + i], led_suit)
         
         # Determine winner
         winner = WizardRules.determine_trick_winner(
@@ -199,10 +219,58 @@ class WizardGame:
         self.state.tricks_won[winner] += 1
         self.state.trick_leader = winner  # Winner leads next trick
         
+        # Report the whole trick at once, keeping the per-card loop free of
+        # verbose checks
         if self.verbose:
+            print(f"\n--- Trick (Leader: Player {self.state.current_trick[0][0]}) ---")
+            for player_idx, card in self.state.current_trick:
+                print(f"  Player {player_idx} plays {card}")
             print(f"  → Player {winner} wins the trick!")
             print(f"  Tricks won so far: {self.state.tricks_won}")
     
+    def _play_card(self, play_fns: List, player_idx: int, led_suit: Optional[Suit]) -> Card:
+        """Have a player play a card to the current trick, and return it"""
+        
+        # Get valid plays (same rule and order as WizardRules.get_valid_plays):
+        # the led suit plus Wizards and Jesters (IDs below FIRST_NORMAL) if
+        # we hold the led suit, otherwise anything. The suit buckets answer
+        # "do we hold it?" without a scan.
+        hand = self.state.hands[player_idx]
+        buckets = self._suit_buckets[player_idx]
+        if led_suit is not None and buckets[led_suit]:
+            valid_cards = [c for c in hand
+                           if c < FIRST_NORMAL or CARD_SUIT[c] == led_suit]
+        else:
+            valid_cards = hand.copy()
+        
+        # Agent chooses card, unless the play is forced (every play in
+        # round 1, for example) - no need to run a search for that
+        if len(valid_cards) == 1:
+            card = valid_cards[0]
+        else:
+            card = play_fns[player_idx](
+                hand=hand,
+                valid_cards=valid_cards,
+                current_trick=self.state.current_trick,
+                trump_suit=self.state.trump_suit,
+                led_suit=led_suit,
+                player_idx=player_idx,
+                state=self.state
+            )
+        
+        # Validate card choice (a linear scan on every play, so it is
+        # skipped under python -O)
+        if __debug__ and card not in valid_cards:
+            raise ValueError(f"Invalid card play: {card} not in {valid_cards}")
+        
+        # Remove card from hand
+        hand.remove(card)
+        buckets[CARD_SUIT[card]].remove(card)
+        
+        # Add to trick
+        self.state.current_trick.append(self._trick_entries[player_idx][card])
+        return card
+    
     def _score_round(self):
         """Calculate and apply scores for the round"""
         
@@ -212,7 +280,7 @@ class WizardGame:
         for player_idx in range(self.num_players):
             bid = self.state.bids[player_idx]
             won = self.state.tricks_won[player_idx]
-            round_score = WizardRules.score_round(bid, won)
+            round_score = SCORE_TABLE[bid][won]
             
             self.scores[player_idx] += round_score
             
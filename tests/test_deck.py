@@ -1,7 +1,7 @@
 import sys
 sys.path.append('..')
 
-from game.deck import Deck, Card, Suit
+from game.deck import Deck, Card, Suit, CARDS, SUIT_MASKS, cards_to_mask
 
 def test_deck_creation():
     """Test that deck has 60 cards"""
@@ -29,8 +29,59 @@ def test_deal_round_15():
     assert trump is None  # All cards dealt
     print("✓ Round 15 dealing works (no trump)")
 
+def test_card_encoding():
+    """Test that cards are interned ints that round-trip suit and rank"""
+    deck = Deck.create_standard_deck()
+    assert sorted(deck) == list(range(60))
+    assert Card(Suit.HEARTS, 13) is Card(Suit.HEARTS, 13)
+    assert Card(Suit.SPADES, 1).suit == Suit.SPADES
+    assert Card(Suit.SPADES, 1).rank == 1
+    assert str(Card(Suit.CLUBS, 12)) == "QC"
+    assert all(Card(c.suit, c.rank) is c for c in CARDS[8:])
+    assert sum(1 for c in deck if c.suit == Suit.WIZARD) == 4
+    assert all(deck)  # Even card 0, a Jester, is truthy
+    assert f"{Suit.DIAMONDS}" == str(Suit.DIAMONDS) == "Suit.DIAMONDS"
+    print("✓ Card encoding works")
+
+def test_cards_are_interned():
+    """Dealing, copying and pickling all reuse the 60 shared card objects"""
+    import copy
+    import pickle
+    
+    hands, trump, remaining = Deck.shuffle_and_deal(num_players=4, round_num=7)
+    dealt = [c for hand in hands for c in hand] + [trump] + remaining
+    assert all(c is CARDS[c] for c in dealt)
+    assert all(copy.deepcopy(c) is c for c in dealt)
+    assert all(pickle.loads(pickle.dumps(c)) is c for c in dealt)
+    print("✓ Cards are interned")
+
+def test_card_masks():
+    """Hand bitmasks agree with the cards' suits"""
+    hands, _, _ = Deck.shuffle_and_deal(num_players=4, round_num=15)
+    for hand in hands:
+        mask = cards_to_mask(hand)
+        for suit in Suit:
+            in_suit = bin(mask & SUIT_MASKS[suit]).count('1')
+            assert in_suit == sum(1 for c in hand if c.suit == suit)
+    assert cards_to_mask(CARDS) == (1 << 60) - 1
+    print("✓ Card bitmasks work")
+
+def test_deal_uses_every_card_once():
+    """Hands, trump and remaining deck split the deck between them"""
+    for round_num in (1, 7, 14, 15):
+        hands, trump, remaining = Deck.shuffle_and_deal(num_players=4, round_num=round_num)
+        dealt = [c for hand in hands for c in hand] + remaining
+        if trump is not None:
+            dealt.append(trump)
+        assert sorted(dealt) == list(CARDS)
+    print("✓ Every card is dealt exactly once")
+
 if __name__ == "__main__":
     test_deck_creation()
+    test_card_encoding()
+    test_cards_are_interned()
+    test_card_masks()
     test_deal_round_1()
     test_deal_round_15()
+    test_deal_uses_every_card_once()
     print("\n✅ All deck tests passed!")
\ No newline at end of file
@@ -58,10 +58,11 @@ def test_multiple_games():
             wins["Random"] += 1
         
         total_scores["Heuristic"] += scores[0]
-        total_scores["Random"] += sum(scores[1:]) / 3  # Average random score
+        random_avg = sum(scores[1:]) / 3  # Average random score
+        total_scores["Random"] += random_avg
         
         print(f"Game {game_num+1}: Heuristic={scores[0]}, "
-              f"Random avg={sum(scores[1:])/3:.1f}")
+              f"Random avg={random_avg:.1f}")
     
     print(f"\n{'='*50}")
     print(f"RESULTS OVER {num_games} GAMES:")
@@ -5,6 +5,11 @@ from game.simulator import WizardGame
 from agents.random_agent import RandomAgent
 from agents.heuristic_agent import HeuristicAgent
 from agents.mcts_simple import SimpleMCTSAgent
+from agents.mcts_agent import MCTSAgent
+from agents._mcts_kernel import rollout
+from game.deck import Deck, Card, Suit
+from game.rules import WizardRules
+from tests.test_simulator import _make_state
 
 def test_mcts_single_game():
     """Test MCTS in a single game"""
@@ -38,8 +43,7 @@ def test_mcts_vs_heuristic():
     wins = {"MCTS": 0, "Heuristic": 0, "Random": 0}
     scores = {"MCTS": [], "Heuristic": [], "Random": []}
     
-    print(f"Running {num_games} games: MCTS vs Heuristic vs Random...")
-    print("(This may take a minute...)\n")
+    print(f"Running {num_games} games: MCTS vs Heuristic vs Random...\n")
     
     for game_num in range(num_games):
         agents = [
@@ -85,7 +89,66 @@ def test_mcts_vs_heuristic():
     
     print("\n✅ Tournament complete!")
 
+def test_rollout_kernel():
+    """Rollouts should finish the round without touching their inputs"""
+    hands, trump, _ = Deck.shuffle_and_deal(num_players=4, round_num=5)
+    trump_suit = WizardRules.get_trump_suit(trump)
+    before = [hand.copy() for hand in hands]
+    
+    # Player 1 plans its first card; player 0 has already led
+    lead = hands[0].pop()
+    plan = [hands[1].pop()]
+    score = rollout(hands, [(0, lead)], 0, trump_suit, [1, 2, 0, 1], [0] * 4,
+                    player_idx=1, plan=plan)
+    
+    assert score in [WizardRules.score_round(2, won) for won in range(6)]
+    assert [len(hand) for hand in hands] == [4, 4, 5, 5]
+    assert hands[2] == before[2] and hands[3] == before[3]
+    print(f"✓ Rollout kernel works (score {score})")
+
+def test_rollout_revoking_plan():
+    """A plan card that fails to follow suit is replaced by a valid one"""
+    # Player 0 has led 5H. Player 1 plans KS then QH, but must follow
+    # with QH and so takes both tricks (QH beats 5H, then KS leads).
+    hands = [[Card(Suit.SPADES, 2)], []]
+    plan = [Card(Suit.SPADES, 13), Card(Suit.HEARTS, 12)]
+    score = rollout(hands, [(0, Card(Suit.HEARTS, 5))], 0, None, [0, 2], [0, 0],
+                    player_idx=1, plan=plan)
+    
+    assert score == WizardRules.score_round(2, 2)
+    assert hands == [[Card(Suit.SPADES, 2)], []]
+    print("✓ Rollout kernel doesn't revoke")
+
+def test_seeded_mcts_agent():
+    """Agents with the same seed sample the same opponent hands"""
+    state = _make_state()
+    
+    worlds = [MCTSAgent(seed=7)._determinize_state(state, 0).hands for _ in range(2)]
+    assert worlds[0] == worlds[1]
+    assert worlds[0][0] == state.hands[0]  # Our own hand is kept
+    print("✓ Seeded MCTS agents are reproducible")
+
+def test_parallel_mcts_agent():
+    """play() with a worker pool returns a valid card; close() stops the pool"""
+    state = _make_state()
+    valid_cards = state.hands[0].copy()
+    agent = MCTSAgent(num_simulations=20, num_determinizations=2, num_workers=2)
+    try:
+        for _ in range(2):  # The second call reuses the pool
+            card = agent.play(state.hands[0], valid_cards, [], state.trump_suit,
+                              None, 0, state)
+            assert card in valid_cards
+    finally:
+        agent.close()
+    assert agent._pool is None
+    print(f"✓ Parallel MCTS agent plays {card}")
+
 if __name__ == "__main__":
+    test_rollout_kernel()
+    test_rollout_revoking_plan()
+    test_seeded_mcts_agent()
+    test_parallel_mcts_agent()
+    
     print("Testing single game with verbose output...\n")
     test_mcts_single_game()
     
@@ -2,7 +2,7 @@ import sys
 sys.path.append('..')
 
 from game.rules import WizardRules
-from game.deck import Card, Suit
+from game.deck import Deck, Card, Suit
 
 def test_wizard_wins():
     """Wizard should always win"""
@@ -31,16 +31,69 @@ def test_trump_beats_led_suit():
     assert winner == 1
     print("✓ Trump beats led suit")
 
+def test_first_wizard_and_jesters():
+    """First Wizard wins; all-Jester trick goes to the leader"""
+    wizards = [c for c in Deck.create_standard_deck() if c.suit == Suit.WIZARD]
+    cards = [
+        (2, Card(Suit.SPADES, 5)),
+        (3, wizards[0]),
+        (0, wizards[1]),
+    ]
+    winner = WizardRules.determine_trick_winner(
+        cards, led_suit=Suit.SPADES, trump_suit=Suit.SPADES
+    )
+    assert winner == 3
+    
+    jesters = [c for c in Deck.create_standard_deck() if c.suit == Suit.JESTER]
+    cards = [(1, jesters[0]), (2, jesters[1]), (3, jesters[2])]
+    winner = WizardRules.determine_trick_winner(
+        cards, led_suit=None, trump_suit=Suit.HEARTS
+    )
+    assert winner == 1
+    print("✓ First Wizard / first Jester tie-breaks")
+
+def test_valid_plays():
+    """Follow suit if you can; Wizards and Jesters are always playable"""
+    wizard, jester = Card(Suit.WIZARD, 0), Card(Suit.JESTER, 0)
+    h3, h10, s7 = Card(Suit.HEARTS, 3), Card(Suit.HEARTS, 10), Card(Suit.SPADES, 7)
+    hand = [h3, s7, wizard, h10, jester]
+    
+    # Leading: anything, in hand order
+    assert WizardRules.get_valid_plays(hand, led_suit=None) == hand
+    # Holding the led suit: that suit plus Wizards and Jesters
+    assert WizardRules.get_valid_plays(hand, led_suit=Suit.HEARTS) == [h3, wizard, h10, jester]
+    # Not holding it: anything
+    assert WizardRules.get_valid_plays(hand, led_suit=Suit.CLUBS) == hand
+    # Only Wizards and Jesters
+    assert WizardRules.get_valid_plays([jester, wizard], led_suit=Suit.SPADES) == [jester, wizard]
+    
+    valid = WizardRules.get_valid_plays(hand, led_suit=None)
+    assert valid is not hand  # A copy, safe for callers to change
+    print("✓ Valid plays follow suit")
+
 def test_scoring():
     """Test score calculation"""
     assert WizardRules.score_round(bid=3, tricks_won=3) == 50  # 20 + 30
     assert WizardRules.score_round(bid=0, tricks_won=0) == 20
     assert WizardRules.score_round(bid=3, tricks_won=1) == -20  # Off by 2
     assert WizardRules.score_round(bid=2, tricks_won=5) == -30  # Off by 3
+    assert WizardRules.score_round(bid=-1, tricks_won=0) == -10  # Beyond the table
+    assert WizardRules.score_round(bid=21, tricks_won=0) == -210
     print("✓ Scoring works correctly")
 
+def test_trump_suit():
+    """Test which suit each turned-up card makes trump"""
+    assert WizardRules.get_trump_suit(None) is None  # Last round
+    assert WizardRules.get_trump_suit(Card(Suit.JESTER, 0)) is None
+    assert WizardRules.get_trump_suit(Card(Suit.WIZARD, 0)) == Suit.HEARTS
+    assert WizardRules.get_trump_suit(Card(Suit.CLUBS, 7)) == Suit.CLUBS
+    print("✓ Trump suit works correctly")
+
 if __name__ == "__main__":
     test_wizard_wins()
     test_trump_beats_led_suit()
+    test_first_wizard_and_jesters()
+    test_valid_plays()
     test_scoring()
+    test_trump_suit()
     print("\n✅ All rules tests passed!")
\ No newline at end of file
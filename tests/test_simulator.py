@@ -1,9 +1,20 @@
 import sys
 sys.path.append('..')
 
-from game.simulator import WizardGame
+from game.simulator import WizardGame, GameState
+from game.deck import Deck
+from game.rules import WizardRules
 from agents.random_agent import RandomAgent
 
+def _make_state(round_num: int = 5) -> GameState:
+    """Freshly dealt 4-player state at the start of a round's first trick"""
+    hands, trump, _ = Deck.shuffle_and_deal(num_players=4, round_num=round_num)
+    return GameState(
+        num_players=4, round_num=round_num, hands=hands, trump_card=trump,
+        trump_suit=WizardRules.get_trump_suit(trump), bids=[1] * 4,
+        tricks_won=[0] * 4, scores=[0] * 4, current_trick=[], trick_leader=0
+    )
+
 def test_full_game():
     """Test playing a complete game"""
     
@@ -36,7 +47,74 @@ def test_quick_game():
     print(f"Quick game result: {scores}")
     print("✅ Quick game works!")
 
+def test_seeded_game():
+    """Games with the same seeds play out identically"""
+    results = []
+    for _ in range(2):
+        agents = [RandomAgent(f"P{i}", seed=i) for i in range(4)]
+        results.append(WizardGame(num_players=4, seed=42).play_full_game(agents))
+    assert results[0] == results[1]
+    print(f"✓ Seeded games repeat: {results[0]}")
+
+def test_valid_plays_match_rules():
+    """The simulator offers exactly WizardRules.get_valid_plays at every play"""
+    game = WizardGame(num_players=4, seed=3)
+    offered = []  # valid_cards the agents were shown for the current play
+    
+    class RecordingAgent(RandomAgent):
+        def play(self, hand, valid_cards, **kwargs):
+            offered.append(valid_cards.copy())
+            return super().play(hand, valid_cards, **kwargs)
+    
+    play_card = game._play_card
+    num_plays = 0
+    
+    def checked_play_card(play_fns, player_idx, led_suit):
+        nonlocal num_plays
+        expected = WizardRules.get_valid_plays(game.state.hands[player_idx], led_suit)
+        offered.clear()
+        card = play_card(play_fns, player_idx, led_suit)
+        # Forced plays don't reach the agent; the rules must agree on those too
+        assert (offered[0] if offered else [card]) == expected
+        num_plays += 1
+        return card
+    
+    game._play_card = checked_play_card
+    game.play_full_game([RecordingAgent(f"P{i}", seed=i) for i in range(4)])
+    assert num_plays == 4 * sum(range(1, 16))
+    print(f"✓ Valid plays match the rules over {num_plays} plays")
+
+def test_apply_undo():
+    """apply() removes a card in place; undo() restores the exact hand"""
+    state = _make_state()
+    before = [hand.copy() for hand in state.hands]
+    
+    tokens = [state.apply(before[1][2], 1), state.apply(before[1][0], 1)]
+    assert state.hands[1] == [before[1][1]] + before[1][3:]
+    
+    for token in reversed(tokens):
+        state.undo(token)
+    assert state.hands == before
+    print("✓ apply/undo restores the state")
+
+def test_mcts_clone():
+    """mcts_clone() copies hands and tricks but shares read-only fields"""
+    state = _make_state()
+    
+    clone = state.mcts_clone()
+    assert clone == state
+    clone.hands[0].pop()
+    clone.tricks_won[0] += 1
+    assert len(state.hands[0]) == 5 and state.tricks_won[0] == 0
+    assert clone.bids is state.bids
+    print("✓ mcts_clone copies only what a search changes")
+
 if __name__ == "__main__":
+    test_valid_plays_match_rules()
+    test_apply_undo()
+    test_mcts_clone()
+    test_seeded_game()
+    
     print("Testing full game with verbose output...")
     test_full_game()
     